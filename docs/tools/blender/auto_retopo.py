@@ -27,6 +27,9 @@ FEATURES:
 - Configurable texture compression (WebP, JPEG, PNG, or KTX2)
 - Optional texture downscaling
 - Preview mode to inspect LODs before export
+- Optional parallel batch mode across headless Blender workers
+  (SETTINGS["parallel_workers"], requires auto_approve)
+- Skips unchanged models on re-runs (fingerprint cache per output folder)
 - Preserves armatures and animations
 - WebGPU vertex buffer cleanup (ensures max 8 vertex buffers)
   * Removes extra UV layers (keeps only first)
@@ -48,6 +51,8 @@ EXTERNAL TOOLS (optional):
 - gltfpack: For optimal Meshopt compression
   https://github.com/zeux/meshoptimizer
   Usage: gltfpack -i input.glb -o output.glb -cc
+  Run automatically in the background on meshopt exports when on PATH and
+  SETTINGS["meshopt_gltfpack"] is enabled (the loader needs MeshoptDecoder)
 
 - KTX-Software: For KTX2/Basis Universal textures
   https://github.com/KhronosGroup/KTX-Software
@@ -68,7 +73,10 @@ USAGE:
 """
 
 import bpy
+import bmesh
+import functools
 import os
+import sys
 import math
 from pathlib import Path
 
@@ -96,6 +104,12 @@ LOD_RATIOS = {
     "units": {"lod1": 0.5, "lod2": 0.25},
 }
 
+# LOD build plan per category, resolved once: (lod_name, ratio) in build order
+LOD_PLAN = {
+    category: (("LOD1", ratios["lod1"]), ("LOD2", ratios["lod2"]))
+    for category, ratios in LOD_RATIOS.items()
+}
+
 SETTINGS = {
     # =========================================================================
     # COMPRESSION MODE: Choose between Draco and Meshopt
@@ -112,10 +126,12 @@ SETTINGS = {
     "draco_normal_quantization": 10,    # 0-30
     "draco_texcoord_quantization": 12,  # 0-30
     "draco_color_quantization": 10,     # 0-30
+    "draco_generic_quantization": 12,   # 0-30, skin weights/joints and other attributes
 
     # Meshopt compression settings (used when compression_mode = "meshopt")
     # Meshopt uses EXT_meshopt_compression extension in glTF
     # Settings are simpler as meshopt auto-optimizes based on mesh characteristics
+    # Blender exports meshopt files uncompressed; see "meshopt_gltfpack" below
 
     # =========================================================================
     # TEXTURE COMPRESSION: Standard vs KTX2/Basis Universal
@@ -134,12 +150,27 @@ SETTINGS = {
     # KTX2/Basis Universal settings (used when texture_format = "KTX2")
     # Requires KTX-Software: https://github.com/KhronosGroup/KTX-Software
     "ktx2_uastc": True,                 # Use UASTC for high quality (vs ETC1S for smaller)
+                                        # Normal maps always use UASTC
     "ktx2_uastc_quality": 2,            # 0-4, higher = better quality (slower)
     "ktx2_zstd_compression": True,      # Apply Zstandard supercompression
     "ktx2_mipmap": True,                # Generate mipmaps in KTX2 file
+    "ktx2_parallel_jobs": 0,            # Max concurrent toktx processes (0 = half the CPU cores)
+                                        # Shared between parallel workers
+
+    # gltfpack post-processing (used when compression_mode = "meshopt")
+    # Requires gltfpack: https://github.com/zeux/meshoptimizer
+    # Output REQUIRES EXT_meshopt_compression: the game's GLTFLoader must call
+    # setMeshoptDecoder() first (AssetManager.ts / EditorModelLoader.ts only
+    # register a DRACOLoader today), or the models will fail to load
+    "meshopt_gltfpack": False,          # Compress meshopt exports with gltfpack in the background
+    "gltfpack_parallel_jobs": 0,        # Max concurrent gltfpack processes (0 = half the CPU cores)
+                                        # Shared between parallel workers
 
     # Processing options
     "auto_approve": False,              # Set True to skip approval prompts
+    "skip_unchanged": True,             # Skip models whose input and settings match the last export
+    "parallel_workers": 0,              # Headless Blender workers for batch mode (0/1 = off)
+                                        # Only used with auto_approve (workers can't prompt)
     "export_lod0": True,                # Export LOD0 (original, just compressed)
     "export_lod1": True,                # Export LOD1
     "export_lod2": True,                # Export LOD2
@@ -153,6 +184,12 @@ SETTINGS = {
     "cleanup_custom_normals": False,    # Clear custom split normals (can change edge shading)
 }
 
+# Per-LOD Draco quantization caps (applied on top of SETTINGS, never raising them)
+# Distant LODs are never seen up close, so they can drop precision bits
+DRACO_LOD_QUANTIZATION = {
+    "LOD2": {"draco_position_quantization": 11, "draco_normal_quantization": 8},
+}
+
 # =============================================================================
 # TEST MODE - Set to True to test with just ONE model
 # =============================================================================
@@ -169,33 +206,30 @@ class UserPrompt:
     @staticmethod
     def refresh_viewport_and_frame(objects):
         """Force viewport refresh and frame camera on processed objects."""
-        bpy.ops.object.select_all(action='DESELECT')
-
-        for obj in objects:
-            if obj and obj.name in bpy.data.objects:
-                obj.select_set(True)
+        select_only([obj for obj in objects if obj and obj.name in bpy.data.objects])
 
         if bpy.context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for region in area.regions:
-                    if region.type == 'WINDOW':
-                        with bpy.context.temp_override(area=area, region=region):
-                            bpy.ops.view3d.view_selected()
-                        break
+        # Headless runs have no screen to frame or redraw
+        if bpy.app.background or bpy.context.screen is None:
+            return
 
+        # Single pass over the screen: frame, set shading and tag each 3D view
         for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.shading.type = 'MATERIAL'
-                        break
+            if area.type != 'VIEW_3D':
+                continue
 
-        for area in bpy.context.screen.areas:
+            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            if region:
+                with bpy.context.temp_override(area=area, region=region):
+                    bpy.ops.view3d.view_selected()
+
+            area.spaces.active.shading.type = 'MATERIAL'
             area.tag_redraw()
 
+        # The approval prompt blocks on input(), so the event loop never gets a
+        # chance to draw; force one synchronous redraw so the LODs are visible
         bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
 
     @staticmethod
@@ -250,13 +284,41 @@ class UserPrompt:
 # MESH UTILITIES
 # =============================================================================
 
-def get_mesh_stats(obj):
-    """Get mesh statistics."""
-    return {
-        "faces": len(obj.data.polygons),
-        "vertices": len(obj.data.vertices),
-        "tris": sum(len(p.vertices) - 2 for p in obj.data.polygons),
-    }
+def select_only(objects, active=None):
+    """
+    Make `objects` the exact selection, only touching objects whose state changes.
+
+    Args:
+        objects: Objects to select (everything else is deselected)
+        active: Optional object to make active
+    """
+    view_layer = bpy.context.view_layer
+    wanted = {obj.name for obj in objects}
+
+    for obj in list(view_layer.objects.selected):
+        if obj.name not in wanted:
+            obj.select_set(False)
+
+    for obj in objects:
+        if not obj.select_get():
+            obj.select_set(True)
+
+    if active is not None:
+        view_layer.objects.active = active
+
+
+def material_uses_node_type(materials, node_type):
+    """
+    Check whether any node-based material contains a node of the given type.
+
+    Stops at the first match instead of scanning every remaining node tree.
+    """
+    return any(
+        node.type == node_type
+        for mat in materials
+        if mat and mat.use_nodes
+        for node in mat.node_tree.nodes
+    )
 
 
 def cleanup_vertex_attributes(obj):
@@ -301,13 +363,7 @@ def cleanup_vertex_attributes(obj):
     # Remove unused vertex color layers (keep at most one if it's actually used)
     if SETTINGS.get("cleanup_vertex_colors", True):
         # Check if vertex colors are used in materials
-        vertex_colors_used = False
-        for mat in obj.data.materials:
-            if mat and mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'VERTEX_COLOR':
-                        vertex_colors_used = True
-                        break
+        vertex_colors_used = material_uses_node_type(mesh.materials, 'VERTEX_COLOR')
 
         if not vertex_colors_used:
             # Remove all vertex color layers if not used
@@ -427,14 +483,7 @@ def get_vertex_attribute_count(obj):
 
     # Tangents (usually computed at export if normal maps exist)
     # Check if any material uses normal maps
-    has_normal_map = False
-    for mat in mesh.materials:
-        if mat and mat.use_nodes:
-            for node in mat.node_tree.nodes:
-                if node.type == 'NORMAL_MAP':
-                    has_normal_map = True
-                    break
-    if has_normal_map:
+    if material_uses_node_type(mesh.materials, 'NORMAL_MAP'):
         count += 1
         details['tangent'] = 1
 
@@ -453,14 +502,15 @@ def create_decimated_lod(source_obj, ratio, lod_name):
     Returns:
         New decimated mesh object
     """
-    # Duplicate the source
-    bpy.ops.object.select_all(action='DESELECT')
-    source_obj.select_set(True)
-    bpy.context.view_layer.objects.active = source_obj
-    bpy.ops.object.duplicate()
-
-    lod = bpy.context.active_object
-    lod.name = lod_name
+    # Create the LOD as a new object sharing the source mesh, instead of
+    # running the duplicate operator. It starts with no modifiers, so
+    # evaluating it below yields exactly the decimated source mesh.
+    lod = bpy.data.objects.new(lod_name, source_obj.data)
+    for collection in source_obj.users_collection:
+        collection.objects.link(lod)
+    lod.parent = source_obj.parent
+    lod.matrix_parent_inverse = source_obj.matrix_parent_inverse.copy()
+    lod.matrix_basis = source_obj.matrix_basis.copy()
 
     original_faces = len(lod.data.polygons)
 
@@ -470,21 +520,56 @@ def create_decimated_lod(source_obj, ratio, lod_name):
     decimate.ratio = max(0.01, min(ratio, 1.0))
     decimate.use_collapse_triangulate = False  # Keep quads where possible
 
-    # Apply the modifier
-    bpy.context.view_layer.objects.active = lod
-    bpy.ops.object.modifier_apply(modifier="Decimate")
-
-    # Fix normals and apply smooth shading to reduce harsh edge lines
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.normals_make_consistent(inside=False)
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-    # Apply smooth shading with angle-based edge preservation (Blender 4+)
-    try:
-        bpy.ops.object.shade_smooth_by_angle(angle=1.0472)  # 60 degrees
-    except:
-        bpy.ops.object.shade_smooth()  # Fallback for older versions
+    # Apply the modifier from a single depsgraph evaluation instead of the
+    # modifier_apply operator
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    decimated_mesh = bpy.data.meshes.new_from_object(
+        lod.evaluated_get(depsgraph),
+        preserve_all_data_layers=True,  # Keep UVs and vertex groups
+        depsgraph=depsgraph,
+    )
+    decimated_mesh.name = lod_name
+
+    lod.modifiers.remove(decimate)
+    lod.data = decimated_mesh
+
+    # Fix normals on the mesh datablock directly (no edit-mode round trip)
+    mesh = lod.data
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    # Apply smooth shading with angle-based edge preservation
+    if hasattr(mesh, "set_sharp_from_angle"):
+        # Blender 4.1+: mesh API, no operator dispatch.
+        # set_sharp_from_angle resets sharp_edge, so remember the edges the
+        # imported mesh marked sharp (the operator keeps them by default)
+        marked_sharp = None
+        if "sharp_edge" in mesh.attributes:
+            marked_sharp = [False] * len(mesh.edges)
+            mesh.attributes["sharp_edge"].data.foreach_get("value", marked_sharp)
+
+        mesh.shade_smooth()
+        mesh.set_sharp_from_angle(angle=1.0472)  # 60 degrees
+
+        if marked_sharp and any(marked_sharp):
+            sharp_attr = mesh.attributes.get("sharp_edge")
+            if sharp_attr is None:
+                sharp_attr = mesh.attributes.new("sharp_edge", 'BOOLEAN', 'EDGE')
+            angle_sharp = [False] * len(mesh.edges)
+            sharp_attr.data.foreach_get("value", angle_sharp)
+            sharp_attr.data.foreach_set(
+                "value", [a or b for a, b in zip(angle_sharp, marked_sharp)]
+            )
+    else:
+        # Operators act on the selection, so select the LOD only here
+        select_only([lod], active=lod)
+        try:
+            bpy.ops.object.shade_smooth_by_angle(angle=1.0472)  # 60 degrees
+        except:
+            bpy.ops.object.shade_smooth()  # Fallback for older versions
 
     new_faces = len(lod.data.polygons)
     print(f"      Decimated: {original_faces:,} -> {new_faces:,} faces ({ratio:.0%})")
@@ -516,6 +601,46 @@ def downscale_textures(max_size=1024):
             img.scale(new_width, new_height)
 
 
+def assign_image_export_formats(objects, color_format):
+    """
+    Give each texture of the objects its own export format.
+
+    Blender's glTF exporter takes one image format per export, but in 'AUTO'
+    mode it encodes every image in its own file_format. Normal maps are set
+    to lossless PNG - WebP/JPEG chroma subsampling distorts the vectors they
+    store - and every other texture to color_format.
+
+    Args:
+        objects: Mesh objects being exported
+        color_format: Image file_format for non-normal-map textures
+
+    Returns:
+        bool: True if any normal map was found
+    """
+    normal_images = set()
+    images = {}
+    for obj in objects:
+        for mat in obj.data.materials:
+            if not (mat and mat.use_nodes):
+                continue
+            for node in mat.node_tree.nodes:
+                if node.type == 'TEX_IMAGE' and node.image:
+                    images[node.image.name] = node.image
+                elif node.type == 'NORMAL_MAP':
+                    color = node.inputs['Color']
+                    if color.is_linked:
+                        source = color.links[0].from_node
+                        if source.type == 'TEX_IMAGE' and source.image:
+                            normal_images.add(source.image.name)
+
+    if not normal_images:
+        return False
+
+    for name, image in images.items():
+        image.file_format = 'PNG' if name in normal_images else color_format
+    return True
+
+
 # =============================================================================
 # GLB IMPORT/EXPORT
 # =============================================================================
@@ -528,7 +653,7 @@ def import_glb(filepath):
         tuple: (mesh_objects, armature_obj) - lists of mesh objects and armature if present
     """
     # Clear selection before import
-    bpy.ops.object.select_all(action='DESELECT')
+    select_only([])
 
     # Import
     bpy.ops.import_scene.gltf(filepath=filepath)
@@ -546,33 +671,256 @@ def import_glb(filepath):
     return mesh_objects, armature_obj
 
 
+@functools.lru_cache(maxsize=1)
 def check_ktx_tools():
-    """Check if KTX-Software tools are available for KTX2 conversion."""
+    """
+    Check if KTX-Software tools are available for KTX2 conversion.
+
+    The PATH lookup runs once per session; every later export reuses the result.
+    """
     import shutil
     return shutil.which('toktx') is not None
 
 
-def convert_textures_to_ktx2(glb_path):
+def get_normal_map_files(gltf_data):
+    """
+    Collect the image file names that materials use as normal maps.
+
+    Args:
+        gltf_data: Parsed glTF JSON
+
+    Returns:
+        set: Image file names (as written next to the .gltf)
+    """
+    from urllib.parse import unquote
+
+    textures = gltf_data.get('textures', [])
+    images = gltf_data.get('images', [])
+    normal_files = set()
+
+    for material in gltf_data.get('materials', []):
+        normal_info = material.get('normalTexture')
+        if normal_info is None:
+            continue
+        source = textures[normal_info['index']].get('source')
+        if source is not None and 'uri' in images[source]:
+            normal_files.add(unquote(images[source]['uri']))
+
+    return normal_files
+
+
+def build_toktx_command(png_path, ktx2_path, is_normal_map=False):
+    """Build the toktx command line for one texture from SETTINGS."""
+    cmd = ['toktx', '--t2']  # Output KTX2 format
+
+    if is_normal_map:
+        # Normal maps hold vectors, not colors: store them with a linear
+        # transfer function so the GPU doesn't sRGB-decode them on sampling
+        cmd.extend(['--assign_oetf', 'linear'])
+
+    # ETC1S shares chroma across blocks, which smears the vector data in a
+    # normal map - those always use UASTC; only color maps follow the setting
+    if SETTINGS["ktx2_uastc"] or is_normal_map:
+        cmd.extend(['--encode', 'uastc'])
+        cmd.extend(['--uastc_quality', str(SETTINGS["ktx2_uastc_quality"])])
+    else:
+        cmd.extend(['--encode', 'etc1s'])
+
+    if SETTINGS["ktx2_zstd_compression"]:
+        cmd.extend(['--zcmp', '19'])  # Zstd compression level
+
+    if SETTINGS["ktx2_mipmap"]:
+        cmd.append('--genmipmap')
+
+    cmd.extend([ktx2_path, png_path])
+    return cmd
+
+
+def get_parallel_jobs(setting_key):
     """
-    Convert textures in a GLB file to KTX2/Basis Universal format.
+    Number of external tool processes (toktx, gltfpack) to run at once.
+
+    Both tools are multithreaded themselves, so a setting of 0 uses half the
+    cores to avoid oversubscribing the CPU.
+    """
+    jobs = SETTINGS.get(setting_key, 0)
+    if jobs > 0:
+        return jobs
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def read_log_tail(log_file, line_count=20):
+    """Read the last lines of a finished process's stderr log file and close it."""
+    log_file.seek(0)
+    tail = log_file.read().decode(errors="replace").splitlines()[-line_count:]
+    log_file.close()
+    return tail
+
+
+def print_tool_failure(message, stderr_tail):
+    """Print a tool failure warning followed by its stderr tail."""
+    print(f"      WARNING: {message}")
+    for line in stderr_tail:
+        print(f"               {line}")
+
+
+# Encoded KTX2 bytes keyed by (PNG content hash, is_normal_map). The LODs of
+# a model export identical textures, so only the first export runs toktx.
+# Cleared per model in cleanup_scene.
+KTX2_CACHE = {}
+
+
+def get_ktx2_cache_key(png_path, is_normal_map):
+    """Hash a PNG's contents for KTX2_CACHE lookups."""
+    import hashlib
+
+    with open(png_path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    return (digest, is_normal_map)
+
+
+def finish_toktx_job(job):
+    """Wait for a toktx process and cache its output on success."""
+    png_file, ktx2_path, cache_key, proc, log_file = job
+    proc.wait()
+    stderr_tail = read_log_tail(log_file)
+
+    if proc.returncode != 0:
+        print_tool_failure(f"KTX2 conversion failed for {png_file}", stderr_tail)
+        # Drop any partial output so the texture stays PNG
+        if os.path.exists(ktx2_path):
+            os.remove(ktx2_path)
+        return False
+
+    with open(ktx2_path, 'rb') as f:
+        KTX2_CACHE[cache_key] = f.read()
+    return True
 
-    This is a post-processing step that:
-    1. Extracts the GLB to glTF + separate files
-    2. Converts textures to KTX2 using toktx
-    3. Re-packs as GLB with KTX2 textures
+
+def pack_gltf_as_glb(gltf_data, base_dir, glb_path):
+    """
+    Pack a glTF with external buffers and images into one self-contained GLB.
+
+    All buffers are merged into a single BIN chunk and every external image
+    is embedded as a bufferView, as Blender's own GLB export does.
+
+    Args:
+        gltf_data: Parsed glTF JSON (modified in place)
+        base_dir: Folder the glTF's relative URIs resolve against
+        glb_path: Output GLB path
+    """
+    import json
+    import struct
+    from urllib.parse import unquote
+
+    binary = bytearray()
+
+    # Merge every buffer into buffer 0, keeping 4-byte alignment
+    buffer_offsets = []
+    for buffer in gltf_data.get('buffers', []):
+        buffer_offsets.append(len(binary))
+        with open(os.path.join(base_dir, unquote(buffer['uri'])), 'rb') as f:
+            binary += f.read()
+        binary += b'\0' * (-len(binary) % 4)
+
+    buffer_views = gltf_data.setdefault('bufferViews', [])
+    for view in buffer_views:
+        view['byteOffset'] = view.get('byteOffset', 0) + buffer_offsets[view['buffer']]
+        view['buffer'] = 0
+
+    # Embed external images
+    for image in gltf_data.get('images', []):
+        if 'uri' not in image:
+            continue
+        with open(os.path.join(base_dir, unquote(image.pop('uri'))), 'rb') as f:
+            data = f.read()
+        buffer_views.append({'buffer': 0, 'byteOffset': len(binary), 'byteLength': len(data)})
+        image['bufferView'] = len(buffer_views) - 1
+        image.setdefault('mimeType', 'image/png')
+        binary += data
+        binary += b'\0' * (-len(binary) % 4)
+
+    gltf_data['buffers'] = [{'byteLength': len(binary)}] if binary else []
+    if not buffer_views:
+        del gltf_data['bufferViews']
+
+    json_chunk = json.dumps(gltf_data, separators=(',', ':')).encode()
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    total_length = 12 + 8 + len(json_chunk) + (8 + len(binary) if binary else 0)
+
+    # Write next to the target and swap in, so a failure never leaves a
+    # truncated GLB behind
+    temp_path = glb_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, total_length))
+        f.write(struct.pack('<I4s', len(json_chunk), b'JSON'))
+        f.write(json_chunk)
+        if binary:
+            f.write(struct.pack('<I4s', len(binary), b'BIN\0'))
+            f.write(binary)
+    os.replace(temp_path, glb_path)
+
+
+def use_ktx2_images(gltf_data, base_dir):
+    """
+    Point converted images at their KTX2 files via KHR_texture_basisu.
+
+    Images whose toktx run failed keep their PNG. KTX2 images are only
+    valid through the extension, so textures using them move their source
+    into KHR_texture_basisu.
+
+    Returns:
+        int: Number of images switched to KTX2
+    """
+    from urllib.parse import unquote
+
+    ktx2_images = set()
+    for index, image in enumerate(gltf_data.get('images', [])):
+        uri = image.get('uri', '')
+        if not uri.endswith('.png'):
+            continue
+        ktx2_uri = uri[:-len('.png')] + '.ktx2'
+        if os.path.exists(os.path.join(base_dir, unquote(ktx2_uri))):
+            image['uri'] = ktx2_uri
+            image['mimeType'] = 'image/ktx2'
+            ktx2_images.add(index)
+
+    for texture in gltf_data.get('textures', []):
+        if texture.get('source') in ktx2_images:
+            extensions = texture.setdefault('extensions', {})
+            extensions['KHR_texture_basisu'] = {'source': texture.pop('source')}
+
+    if ktx2_images:
+        for key in ('extensionsUsed', 'extensionsRequired'):
+            extension_list = gltf_data.setdefault(key, [])
+            if 'KHR_texture_basisu' not in extension_list:
+                extension_list.append('KHR_texture_basisu')
+
+    return len(ktx2_images)
+
+
+def export_glb_with_ktx2(glb_path, export_params):
+    """
+    Export a GLB whose textures are KTX2/Basis Universal.
+
+    Blender's exporter can't write KTX2, so this:
+    1. Exports glTF + separate PNG files with the same export settings
+    2. Converts the PNGs to KTX2 using toktx
+    3. Packs the glTF, buffers and KTX2 images into the final GLB
 
     Requires KTX-Software tools: https://github.com/KhronosGroup/KTX-Software
 
     Args:
-        glb_path: Path to the GLB file to process
+        glb_path: Output GLB path
+        export_params: Parameters for the regular GLB export
 
     Returns:
-        bool: True if conversion succeeded
+        bool: True if the GLB was written (the caller falls back to a plain
+              GLB export otherwise)
     """
     import subprocess
     import tempfile
     import json
-    import shutil
 
     if not check_ktx_tools():
         print("      WARNING: KTX-Software tools not found. Install from:")
@@ -585,88 +933,187 @@ def convert_textures_to_ktx2(glb_path):
         with tempfile.TemporaryDirectory() as temp_dir:
             gltf_path = os.path.join(temp_dir, "model.gltf")
 
-            # Extract GLB to glTF + separate files
-            # (Blender's exporter can't directly output KTX2, so we convert after)
-            bpy.ops.export_scene.gltf(
-                filepath=gltf_path,
-                use_selection=True,
-                export_format='GLTF_SEPARATE',
-                export_image_format='PNG',  # Export as PNG first
-                export_materials='EXPORT',
-                export_animations=True,
-                export_animation_mode='ACTIONS',
-                export_apply=True,
-            )
+            # Same export (compression included) as the GLB, but with
+            # external PNG images that toktx can read
+            bpy.ops.export_scene.gltf(**{
+                **export_params,
+                "filepath": gltf_path,
+                "export_format": 'GLTF_SEPARATE',
+                "export_image_format": 'PNG',
+            })
 
             # Find all PNG textures
             png_files = [f for f in os.listdir(temp_dir) if f.endswith('.png')]
 
-            # Convert each texture to KTX2
+            with open(gltf_path, 'r') as f:
+                gltf_data = json.load(f)
+            normal_map_files = get_normal_map_files(gltf_data)
+
+            # Run toktx conversions concurrently - textures are independent,
+            # so the encoders overlap instead of running one after another
+            max_jobs = get_parallel_jobs("ktx2_parallel_jobs")
+            running = []
             for png_file in png_files:
+                if len(running) >= max_jobs:
+                    finish_toktx_job(running.pop(0))
+
                 png_path = os.path.join(temp_dir, png_file)
-                ktx2_path = os.path.join(temp_dir, png_file.replace('.png', '.ktx2'))
+                ktx2_path = os.path.splitext(png_path)[0] + '.ktx2'
+                is_normal_map = png_file in normal_map_files
+
+                # Reuse the encode from an earlier LOD of the same model
+                cache_key = get_ktx2_cache_key(png_path, is_normal_map)
+                cached = KTX2_CACHE.get(cache_key)
+                if cached is not None:
+                    with open(ktx2_path, 'wb') as f:
+                        f.write(cached)
+                    continue
 
-                # Build toktx command
-                cmd = ['toktx', '--t2']  # Output KTX2 format
+                # stderr goes to a temp file rather than a pipe: a pipe that
+                # isn't drained while other jobs are awaited can fill up and
+                # stall the encoder
+                cmd = build_toktx_command(png_path, ktx2_path, is_normal_map)
+                log_file = tempfile.TemporaryFile()
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=log_file,
+                )
+                running.append((png_file, ktx2_path, cache_key, proc, log_file))
+
+            # Wait for the remaining conversions
+            for job in running:
+                finish_toktx_job(job)
+
+            converted = use_ktx2_images(gltf_data, temp_dir)
+            pack_gltf_as_glb(gltf_data, temp_dir, glb_path)
+            print(f"      KTX2 textures: {converted}/{len(png_files)} converted")
 
-                if SETTINGS["ktx2_uastc"]:
-                    cmd.extend(['--encode', 'uastc'])
-                    cmd.extend(['--uastc_quality', str(SETTINGS["ktx2_uastc_quality"])])
-                else:
-                    cmd.extend(['--encode', 'etc1s'])
+            return True
 
-                if SETTINGS["ktx2_zstd_compression"]:
-                    cmd.extend(['--zcmp', '19'])  # Zstd compression level
+    except Exception as e:
+        print(f"      ERROR: KTX2 conversion failed: {e}")
+        return False
 
-                if SETTINGS["ktx2_mipmap"]:
-                    cmd.append('--genmipmap')
 
-                cmd.extend([ktx2_path, png_path])
+# Exporter parameters shared by every LOD export
+GLB_EXPORT_PARAMS = {
+    "use_selection": True,
+    "export_format": 'GLB',
 
-                # Run conversion
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"      WARNING: KTX2 conversion failed for {png_file}")
-                    print(f"               {result.stderr}")
-                    continue
+    # Material export
+    "export_materials": 'EXPORT',
 
-                # Remove original PNG
-                os.remove(png_path)
+    # Animation (preserve if present)
+    "export_animations": True,
+    "export_animation_mode": 'ACTIONS',
 
-            # Update glTF to reference KTX2 files
-            with open(gltf_path, 'r') as f:
-                gltf_data = json.load(f)
+    # Other optimizations
+    "export_apply": True,  # Apply modifiers
+}
 
-            # Update image references
-            if 'images' in gltf_data:
-                for image in gltf_data['images']:
-                    if 'uri' in image and image['uri'].endswith('.png'):
-                        image['uri'] = image['uri'].replace('.png', '.ktx2')
-                        image['mimeType'] = 'image/ktx2'
 
-            # Add KTX2 extension
-            if 'extensionsUsed' not in gltf_data:
-                gltf_data['extensionsUsed'] = []
-            if 'KHR_texture_basisu' not in gltf_data['extensionsUsed']:
-                gltf_data['extensionsUsed'].append('KHR_texture_basisu')
+def get_draco_export_params(lod_name=None):
+    """Build Draco exporter parameters, applying any per-LOD quantization overrides."""
+    draco = {key: SETTINGS[key] for key in (
+        "draco_position_quantization",
+        "draco_normal_quantization",
+        "draco_texcoord_quantization",
+        "draco_color_quantization",
+        "draco_generic_quantization",
+    )}
+    # Overrides only ever lower precision: a global setting already below
+    # the override wins, so a distant LOD never gets more bits than LOD0
+    for key, bits in DRACO_LOD_QUANTIZATION.get(lod_name, {}).items():
+        draco[key] = min(draco[key], bits)
 
-            with open(gltf_path, 'w') as f:
-                json.dump(gltf_data, f)
+    return {
+        "export_draco_mesh_compression_enable": True,
+        "export_draco_mesh_compression_level": SETTINGS["draco_compression_level"],
+        "export_draco_position_quantization": draco["draco_position_quantization"],
+        "export_draco_normal_quantization": draco["draco_normal_quantization"],
+        "export_draco_texcoord_quantization": draco["draco_texcoord_quantization"],
+        "export_draco_color_quantization": draco["draco_color_quantization"],
+        "export_draco_generic_quantization": draco["draco_generic_quantization"],
+    }
 
-            # Re-pack as GLB (this requires gltf-pipeline or similar tool)
-            # For now, we'll just copy the processed files
-            # In production, you'd use gltf-pipeline to create the final GLB
-            print("      NOTE: KTX2 textures created. Use gltf-pipeline to pack final GLB.")
-            print(f"            Temp files in: {temp_dir}")
 
-            return True
+def format_file_size(path):
+    """Human-readable size of a file, e.g. "1.25 MB" or "340.2 KB"."""
+    size_bytes = os.path.getsize(path)
+    if size_bytes > 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.2f} MB"
+    return f"{size_bytes / 1024:.1f} KB"
 
-    except Exception as e:
-        print(f"      ERROR: KTX2 conversion failed: {e}")
+
+# gltfpack jobs still running: (output_path, packed_path, process, log_file)
+PENDING_GLTFPACK = []
+
+# Output paths whose gltfpack run failed (they keep the uncompressed export)
+GLTFPACK_FAILED = set()
+
+
+@functools.lru_cache(maxsize=1)
+def check_gltfpack():
+    """Check if gltfpack is available for meshopt post-processing."""
+    import shutil
+    return shutil.which('gltfpack') is not None
+
+
+def finish_gltfpack_job(job):
+    """Wait for a gltfpack process and swap the packed file into place."""
+    output_path, packed_path, proc, log_file = job
+    proc.wait()
+    stderr_tail = read_log_tail(log_file)
+
+    if proc.returncode != 0 or not os.path.exists(packed_path):
+        # Keep the uncompressed export so the model still loads
+        print_tool_failure(f"gltfpack failed for {output_path}", stderr_tail)
+        if os.path.exists(packed_path):
+            os.remove(packed_path)
+        GLTFPACK_FAILED.add(output_path)
         return False
 
+    os.replace(packed_path, output_path)
+    print(f"      gltfpack done: {output_path} ({format_file_size(output_path)})")
+    return True
+
+
+def start_gltfpack(output_path):
+    """
+    Compress an exported GLB with gltfpack without blocking the batch loop.
+
+    gltfpack writes to a side file that replaces the export once it succeeds,
+    so an interrupted run never leaves a truncated GLB behind. At most
+    SETTINGS["gltfpack_parallel_jobs"] processes run at once.
+    """
+    import subprocess
+    import tempfile
+
+    while len(PENDING_GLTFPACK) >= get_parallel_jobs("gltfpack_parallel_jobs"):
+        finish_gltfpack_job(PENDING_GLTFPACK.pop(0))
+
+    packed_path = output_path + ".gltfpack.glb"
+    log_file = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        ['gltfpack', '-i', output_path, '-o', packed_path, '-cc'],
+        stdout=subprocess.DEVNULL,
+        stderr=log_file,
+    )
+    PENDING_GLTFPACK.append((output_path, packed_path, proc, log_file))
+
+
+def finish_pending_gltfpack():
+    """Wait for every queued gltfpack job to finish."""
+    if not PENDING_GLTFPACK:
+        return
+
+    print(f"\n  Waiting for {len(PENDING_GLTFPACK)} gltfpack job(s)...")
+    while PENDING_GLTFPACK:
+        finish_gltfpack_job(PENDING_GLTFPACK.pop(0))
+
 
-def export_glb(objects, armature, output_path):
+def export_glb(objects, armature, output_path, lod_name=None):
     """
     Export objects as GLB with configurable mesh compression (Draco or Meshopt).
 
@@ -679,6 +1126,7 @@ def export_glb(objects, armature, output_path):
         objects: List of mesh objects to export
         armature: Armature object (or None)
         output_path: Output file path
+        lod_name: LOD level ("LOD0", "LOD1", ...) for per-LOD quantization
     """
     # Validate vertex attribute count before export
     for obj in objects:
@@ -696,18 +1144,10 @@ def export_glb(objects, armature, output_path):
                     print(f"      Fixed: Now {attr_count} attributes")
 
     # Select objects for export
-    bpy.ops.object.select_all(action='DESELECT')
-
-    for obj in objects:
-        obj.select_set(True)
-
     if armature:
-        armature.select_set(True)
-        bpy.context.view_layer.objects.active = armature
-
-    # Downscale textures if enabled
-    if SETTINGS["downscale_textures"]:
-        downscale_textures(SETTINGS["max_texture_size"])
+        select_only(list(objects) + [armature], active=armature)
+    else:
+        select_only(objects)
 
     # Determine compression mode
     compression_mode = SETTINGS.get("compression_mode", "draco")
@@ -723,36 +1163,25 @@ def export_glb(objects, armature, output_path):
     else:
         do_ktx2_conversion = False
 
+    # Lossy formats would smear normal maps: keep those PNG and let the
+    # exporter pick each image's format
+    if texture_format in ("WEBP", "JPEG") and assign_image_export_formats(objects, texture_format):
+        print(f"      Textures: normal maps as PNG, others as {texture_format}")
+        texture_format = "AUTO"
+
     # Build export parameters
     export_params = {
+        **GLB_EXPORT_PARAMS,
         "filepath": output_path,
-        "use_selection": True,
-        "export_format": 'GLB',
 
         # Texture format
         "export_image_format": texture_format,
-
-        # Material export
-        "export_materials": 'EXPORT',
-
-        # Animation (preserve if present)
-        "export_animations": True,
-        "export_animation_mode": 'ACTIONS',
-
-        # Other optimizations
-        "export_apply": True,  # Apply modifiers
+        "export_image_quality": SETTINGS["texture_quality"],  # WEBP/JPEG only
     }
 
     # Add compression-specific parameters
     if use_draco:
-        export_params.update({
-            "export_draco_mesh_compression_enable": True,
-            "export_draco_mesh_compression_level": SETTINGS["draco_compression_level"],
-            "export_draco_position_quantization": SETTINGS["draco_position_quantization"],
-            "export_draco_normal_quantization": SETTINGS["draco_normal_quantization"],
-            "export_draco_texcoord_quantization": SETTINGS["draco_texcoord_quantization"],
-            "export_draco_color_quantization": SETTINGS["draco_color_quantization"],
-        })
+        export_params.update(get_draco_export_params(lod_name))
         print(f"      Compression: Draco (level {SETTINGS['draco_compression_level']})")
 
     elif use_meshopt:
@@ -763,42 +1192,56 @@ def export_glb(objects, armature, output_path):
             export_params["export_draco_mesh_compression_enable"] = False
             # Note: Meshopt export may require Blender 4.0+ or gltfpack post-processing
             print("      Compression: Meshopt (via EXT_meshopt_compression)")
-            print("      NOTE: For optimal meshopt compression, run 'gltfpack' on the output:")
-            print(f"            gltfpack -i {output_path} -o {output_path} -cc")
+            if not (SETTINGS["meshopt_gltfpack"] and check_gltfpack()):
+                print("      NOTE: For optimal meshopt compression, run 'gltfpack' on the output:")
+                print(f"            gltfpack -i {output_path} -o {output_path} -cc")
         except:
             print("      WARNING: Meshopt not available in this Blender version")
             print("               Falling back to Draco compression")
-            export_params.update({
-                "export_draco_mesh_compression_enable": True,
-                "export_draco_mesh_compression_level": SETTINGS["draco_compression_level"],
-                "export_draco_position_quantization": SETTINGS["draco_position_quantization"],
-                "export_draco_normal_quantization": SETTINGS["draco_normal_quantization"],
-                "export_draco_texcoord_quantization": SETTINGS["draco_texcoord_quantization"],
-                "export_draco_color_quantization": SETTINGS["draco_color_quantization"],
-            })
-
-    # Export the GLB
-    bpy.ops.export_scene.gltf(**export_params)
+            export_params.update(get_draco_export_params(lod_name))
 
-    # Post-process for KTX2 textures if requested
-    if do_ktx2_conversion and os.path.exists(output_path):
+    # Export the GLB (KTX2 goes through glTF + toktx + repack instead,
+    # falling back to a plain PNG export if that isn't possible)
+    exported = False
+    if do_ktx2_conversion:
         print("      Converting textures to KTX2/Basis Universal...")
-        convert_textures_to_ktx2(output_path)
+        exported = export_glb_with_ktx2(output_path, export_params)
+    if not exported:
+        bpy.ops.export_scene.gltf(**export_params)
 
-    # Report file size
-    if os.path.exists(output_path):
-        size_bytes = os.path.getsize(output_path)
-        if size_bytes > 1024 * 1024:
-            size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            size_str = f"{size_bytes / 1024:.1f} KB"
-        print(f"      Exported: {output_path} ({size_str})")
+    if not os.path.exists(output_path):
+        return
+
+    # Report file size (gltfpack reports the final size when it finishes)
+    run_gltfpack = use_meshopt and SETTINGS["meshopt_gltfpack"] and check_gltfpack()
+    size_label = ", pre-gltfpack" if run_gltfpack else ""
+    print(f"      Exported: {output_path} ({format_file_size(output_path)}{size_label})")
+
+    # Compress meshopt exports in the background while the next LOD/model is built
+    if run_gltfpack:
+        print("      Queued gltfpack meshopt compression")
+        start_gltfpack(output_path)
 
 
 # =============================================================================
 # MODEL PROCESSING
 # =============================================================================
 
+def attach_armature(lod_obj, armature_obj, armature_mod=None):
+    """
+    Parent a LOD to the armature and copy the source's armature modifier.
+
+    Args:
+        lod_obj: LOD mesh object
+        armature_obj: Armature object to parent to
+        armature_mod: The source mesh's ARMATURE modifier (or None)
+    """
+    lod_obj.parent = armature_obj
+    if armature_mod:
+        new_mod = lod_obj.modifiers.new("Armature", 'ARMATURE')
+        new_mod.object = armature_mod.object
+
+
 def process_glb_model(filepath, category, output_dir):
     """
     Process a GLB model: create LODs and export with compression.
@@ -860,45 +1303,33 @@ def process_glb_model(filepath, category, output_dir):
         print(f"  Armature: {armature_obj.name} ({bone_count} bones)")
         print(f"  Animations: {anim_count} action(s)")
 
-    # Get LOD ratios for this category
-    ratios = LOD_RATIOS.get(category, LOD_RATIOS["units"])
+    # Get the LOD plan for this category
+    lod_plan = LOD_PLAN.get(category, LOD_PLAN["units"])
 
     # Track all LODs
     lods = {"LOD0": primary_mesh}
     lod_stats = {"original_faces": original_faces, "lod0_faces": original_faces}
 
-    # Create LOD1
-    if SETTINGS["export_lod1"]:
-        print(f"\n  Creating LOD1...")
-        lod1 = create_decimated_lod(primary_mesh, ratios["lod1"], f"{filename}_LOD1")
-        lods["LOD1"] = lod1
-        lod_stats["lod1_faces"] = len(lod1.data.polygons)
+    # Resolve the source armature modifier once for every LOD
+    armature_mod = next((m for m in primary_mesh.modifiers if m.type == 'ARMATURE'), None)
 
-        # Copy armature relationship if present
-        if armature_obj:
-            lod1.parent = armature_obj
-            # Copy armature modifier
-            for mod in primary_mesh.modifiers:
-                if mod.type == 'ARMATURE':
-                    new_mod = lod1.modifiers.new("Armature", 'ARMATURE')
-                    new_mod.object = mod.object
-                    break
-
-    # Create LOD2
-    if SETTINGS["export_lod2"]:
-        print(f"\n  Creating LOD2...")
-        lod2 = create_decimated_lod(primary_mesh, ratios["lod2"], f"{filename}_LOD2")
-        lods["LOD2"] = lod2
-        lod_stats["lod2_faces"] = len(lod2.data.polygons)
+    # Create LOD1, LOD2 - each LOD is decimated from the previous one, so
+    # LOD2 collapses the already-halved LOD1 instead of the full mesh.
+    # LOD_RATIOS stay relative to the original; convert to a step ratio.
+    base_obj, base_ratio = primary_mesh, 1.0
+    for lod_name, ratio in lod_plan:
+        if not SETTINGS[f"export_{lod_name.lower()}"]:
+            continue
+
+        print(f"\n  Creating {lod_name}...")
+        lod = create_decimated_lod(base_obj, ratio / base_ratio, f"{filename}_{lod_name}")
+        lods[lod_name] = lod
+        base_obj, base_ratio = lod, ratio
+        lod_stats[f"{lod_name.lower()}_faces"] = len(lod.data.polygons)
 
         # Copy armature relationship if present
         if armature_obj:
-            lod2.parent = armature_obj
-            for mod in primary_mesh.modifiers:
-                if mod.type == 'ARMATURE':
-                    new_mod = lod2.modifiers.new("Armature", 'ARMATURE')
-                    new_mod.object = mod.object
-                    break
+            attach_armature(lod, armature_obj, armature_mod)
 
     # Stats for approval
     stats = {
@@ -945,17 +1376,19 @@ def process_glb_model(filepath, category, output_dir):
     if response == "approve":
         print(f"\n  Exporting with Draco compression...")
 
+        # All LODs share the same images, so downscale them once per model
+        # rather than rescanning every image on each LOD export
+        if SETTINGS["downscale_textures"]:
+            downscale_textures(SETTINGS["max_texture_size"])
+
         # Export each LOD
+        export_gates = {name: SETTINGS[f"export_{name.lower()}"] for name in lods}
         for lod_name, lod_obj in lods.items():
-            if lod_name == "LOD0" and not SETTINGS["export_lod0"]:
-                continue
-            if lod_name == "LOD1" and not SETTINGS["export_lod1"]:
-                continue
-            if lod_name == "LOD2" and not SETTINGS["export_lod2"]:
+            if not export_gates[lod_name]:
                 continue
 
             output_path = os.path.join(output_dir, f"{filename}_{lod_name}.glb")
-            export_glb([lod_obj], armature_obj, output_path)
+            export_glb([lod_obj], armature_obj, output_path, lod_name)
 
         print(f"  Done: {filename}")
 
@@ -978,62 +1411,59 @@ def process_glb_model(filepath, category, output_dir):
 
 def cleanup_scene(objects):
     """Remove objects from scene."""
-    for obj in objects:
-        if obj and obj.name in bpy.data.objects:
-            bpy.data.objects.remove(obj, do_unlink=True)
-
-    # Clean orphan data
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
+    KTX2_CACHE.clear()
 
-    for block in bpy.data.materials:
-        if block.users == 0:
-            bpy.data.materials.remove(block)
+    # Remove all objects in one batch (one relations/depsgraph update, not one per object)
+    doomed = [obj for obj in objects if obj and obj.name in bpy.data.objects]
+    if doomed:
+        bpy.data.batch_remove(doomed)
 
-    for block in bpy.data.images:
-        if block.users == 0:
-            bpy.data.images.remove(block)
+    # Clean all orphan data in one recursive C-side sweep
+    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=False, do_recursive=True)
 
-    for block in bpy.data.armatures:
-        if block.users == 0:
-            bpy.data.armatures.remove(block)
 
-    for block in bpy.data.actions:
-        if block.users == 0:
-            bpy.data.actions.remove(block)
+def get_cleanup_collections():
+    """Data-block collections that are freed between models."""
+    return (
+        bpy.data.meshes,
+        bpy.data.materials,
+        bpy.data.images,
+        bpy.data.armatures,
+        bpy.data.actions,
+    )
 
 
 def clear_scene():
     """Clear entire scene for fresh start."""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    # Objects and all their data go in a single batch - no selection or
+    # delete operator, and one relations update instead of one per ID
+    doomed = list(bpy.data.objects)
+    for collection in get_cleanup_collections():
+        doomed.extend(collection)
 
-    for block in bpy.data.meshes:
-        bpy.data.meshes.remove(block)
-    for block in bpy.data.materials:
-        bpy.data.materials.remove(block)
-    for block in bpy.data.images:
-        bpy.data.images.remove(block)
-    for block in bpy.data.armatures:
-        bpy.data.armatures.remove(block)
-    for block in bpy.data.actions:
-        bpy.data.actions.remove(block)
+    if doomed:
+        bpy.data.batch_remove(doomed)
 
 
 # =============================================================================
 # FILE DISCOVERY
 # =============================================================================
 
+GLB_EXTENSIONS = ('.glb', '.gltf')
+
+
 def get_glb_files(folder_path):
     """Get list of GLB files in a folder."""
     if not os.path.exists(folder_path):
         return []
 
-    files = []
-    for f in os.listdir(folder_path):
-        if f.lower().endswith(('.glb', '.gltf')):
-            files.append(os.path.join(folder_path, f))
+    # scandir reuses the directory entry type, so skipping subfolders
+    # that happen to end in .glb costs no extra stat() per file
+    with os.scandir(folder_path) as entries:
+        files = [
+            entry.path for entry in entries
+            if entry.name.lower().endswith(GLB_EXTENSIONS) and entry.is_file()
+        ]
 
     files.sort()
     return files
@@ -1041,81 +1471,274 @@ def get_glb_files(folder_path):
 
 def interactive_test_select():
     """Interactive selection for test mode."""
-    print("\n" + "="*60)
-    print("  SELECT MODEL TO TEST")
-    print("="*60)
-
-    # Find available folders
+    # Find available folders (scanned once - backing out of the model list
+    # reuses these file lists instead of listing every folder again)
     available_folders = []
     for key, path in INPUT_FOLDERS.items():
         if path and not path.startswith("/path/to") and os.path.exists(path):
             files = get_glb_files(path)
             if files:
-                available_folders.append((key, path, len(files)))
+                available_folders.append((key, path, files))
 
     if not available_folders:
         print("\n  ERROR: No configured folders with GLB models found!")
         print("  Please set INPUT_FOLDERS paths in the script.")
         return None
 
-    # List folders
-    print("\n  Available folders:")
-    print("-"*60)
-    for i, (key, path, count) in enumerate(available_folders):
-        print(f"    [{i+1}] {key.upper()} ({count} GLB files)")
-    print(f"    [q] Quit")
-    print("-"*60)
+    while True:
+        print("\n" + "="*60)
+        print("  SELECT MODEL TO TEST")
+        print("="*60)
 
-    try:
-        choice = input("  Select folder number: ").strip().lower()
-        if choice == 'q':
+        # List folders
+        print("\n  Available folders:")
+        print("-"*60)
+        for i, (key, path, files) in enumerate(available_folders):
+            print(f"    [{i+1}] {key.upper()} ({len(files)} GLB files)")
+        print(f"    [q] Quit")
+        print("-"*60)
+
+        try:
+            choice = input("  Select folder number: ").strip().lower()
+            if choice == 'q':
+                return None
+            folder_idx = int(choice) - 1
+            if folder_idx < 0 or folder_idx >= len(available_folders):
+                print("  Invalid selection")
+                return None
+        except (ValueError, EOFError):
             return None
-        folder_idx = int(choice) - 1
-        if folder_idx < 0 or folder_idx >= len(available_folders):
-            print("  Invalid selection")
+
+        folder_key, folder_path, files = available_folders[folder_idx]
+
+        # List models
+        print(f"\n  GLB files in {folder_key.upper()}:")
+        print("-"*60)
+        # Only the chosen folder's files are stat'd, for their sizes
+        for i, filepath in enumerate(files):
+            name = Path(filepath).stem
+            size_bytes = os.path.getsize(filepath)
+            if size_bytes > 1024 * 1024:
+                size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
+            else:
+                size_str = f"{size_bytes / 1024:.0f} KB"
+            print(f"    [{i+1}] {name} ({size_str})")
+        print(f"    [q] Back")
+        print("-"*60)
+
+        try:
+            choice = input("  Select model number: ").strip().lower()
+            if choice == 'q':
+                continue
+            model_idx = int(choice) - 1
+            if model_idx < 0 or model_idx >= len(files):
+                print("  Invalid selection")
+                return None
+        except (ValueError, EOFError):
             return None
-    except (ValueError, EOFError):
-        return None
 
-    folder_key, folder_path, _ = available_folders[folder_idx]
+        return (folder_key, files[model_idx])
 
-    # List models
-    files = get_glb_files(folder_path)
 
-    print(f"\n  GLB files in {folder_key.upper()}:")
-    print("-"*60)
-    for i, filepath in enumerate(files):
-        name = Path(filepath).stem
-        size_bytes = os.path.getsize(filepath)
-        if size_bytes > 1024 * 1024:
-            size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            size_str = f"{size_bytes / 1024:.0f} KB"
-        print(f"    [{i+1}] {name} ({size_str})")
-    print(f"    [q] Back")
-    print("-"*60)
+# =============================================================================
+# OUTPUT CACHE
+# =============================================================================
+
+CACHE_MANIFEST_PREFIX = ".voidstrike_cache"
+
+# SETTINGS that change how the batch runs, not what it writes
+RUNTIME_ONLY_SETTINGS = {
+    "auto_approve",
+    "skip_unchanged",
+    "parallel_workers",
+    "ktx2_parallel_jobs",
+    "gltfpack_parallel_jobs",
+}
+
+
+def get_model_fingerprint(filepath, category):
+    """
+    Fingerprint an input model together with everything that shapes its output.
+
+    Covers the file's path, size and mtime plus the output-affecting SETTINGS,
+    this category's LOD plan and whether gltfpack will post-process the
+    export, so editing any of them (or installing gltfpack) forces a re-export.
+    """
+    import hashlib
+    import json
+
+    st = os.stat(filepath)
+    output_settings = {k: v for k, v in SETTINGS.items() if k not in RUNTIME_ONLY_SETTINGS}
+    lod_plan = LOD_PLAN.get(category, LOD_PLAN["units"])
+    uses_gltfpack = (
+        SETTINGS.get("compression_mode", "draco") == "meshopt"
+        and SETTINGS["meshopt_gltfpack"]
+        and check_gltfpack()
+    )
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(
+        [output_settings, lod_plan, DRACO_LOD_QUANTIZATION, uses_gltfpack], sort_keys=True
+    ).encode())
+    digest.update(os.path.abspath(filepath).encode())
+    digest.update(f"{st.st_mtime_ns}:{st.st_size}".encode())
+    return digest.hexdigest()
+
+
+def get_expected_outputs(filename, category, output_dir):
+    """GLB paths that process_glb_model writes for an approved model."""
+    lod_names = ["LOD0"] + [name for name, _ in LOD_PLAN.get(category, LOD_PLAN["units"])]
+    return [
+        os.path.join(output_dir, f"{filename}_{lod_name}.glb")
+        for lod_name in lod_names
+        if SETTINGS[f"export_{lod_name.lower()}"]
+    ]
+
+
+def get_cache_manifest_path(output_dir, shard=None):
+    """
+    Manifest file this run writes to.
+
+    Parallel workers each write only their own new entries to a shard file,
+    so concurrent workers never overwrite each other. The parent folds the
+    shard files into the main manifest once the workers finish.
+    """
+    suffix = f".shard{shard[0]}" if shard else ""
+    return os.path.join(output_dir, f"{CACHE_MANIFEST_PREFIX}{suffix}.json")
+
+
+def read_cache_manifest(manifest_path):
+    """
+    Read one manifest file; a missing or unreadable file reads as empty.
 
+    Returns:
+        dict: absolute input path -> {"fingerprint": str, "outputs": [paths]}
+    """
+    import json
+
+    if not os.path.exists(manifest_path):
+        return {}
     try:
-        choice = input("  Select model number: ").strip().lower()
-        if choice == 'q':
-            return interactive_test_select()
-        model_idx = int(choice) - 1
-        if model_idx < 0 or model_idx >= len(files):
-            print("  Invalid selection")
-            return None
-    except (ValueError, EOFError):
-        return None
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  WARNING: Ignoring unreadable cache manifest {manifest_path}: {e}")
+        return {}
+
+
+def consolidate_cache_manifests(output_dir):
+    """
+    Fold worker shard manifests into the main manifest and delete them.
+
+    Every run consolidates before it starts, so any shard file left behind
+    is newer than the main manifest and its entries take precedence.
+
+    Returns:
+        dict: The consolidated manifest
+    """
+    main_path = get_cache_manifest_path(output_dir)
+    manifest = read_cache_manifest(main_path)
+
+    with os.scandir(output_dir) as entries:
+        shard_paths = sorted(
+            entry.path for entry in entries
+            if entry.name.startswith(f"{CACHE_MANIFEST_PREFIX}.shard") and entry.name.endswith(".json")
+        )
+    if not shard_paths:
+        return manifest
+
+    for shard_path in shard_paths:
+        manifest.update(read_cache_manifest(shard_path))
+    save_cache_manifest(manifest, main_path)
+    for shard_path in shard_paths:
+        os.remove(shard_path)
+    return manifest
+
+
+def consolidate_all_cache_manifests():
+    """Consolidate the manifests of every category output folder."""
+    for folder_key in INPUT_FOLDERS:
+        output_dir = os.path.join(OUTPUT_FOLDER, folder_key)
+        if os.path.isdir(output_dir):
+            consolidate_cache_manifests(output_dir)
+
+
+def save_cache_manifest(manifest, manifest_path):
+    """Write the manifest atomically so an interrupted run can't corrupt it."""
+    import json
+
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(temp_path, manifest_path)
+
+
+def record_finished_cache_entries(pending_entries, manifest, new_entries, manifest_path):
+    """
+    Record the pending cache entries whose outputs are final.
+
+    An entry waits while any of its outputs still has a gltfpack job queued,
+    and is dropped if gltfpack failed on one of them, so that model is
+    exported again on the next run.
+
+    Args:
+        pending_entries: List of (input key, entry) awaiting their outputs
+        manifest: Manifest used for lookups this run
+        new_entries: Entries this run writes to manifest_path
+        manifest_path: Manifest file this run writes to
+
+    Returns:
+        list: The entries still waiting on gltfpack
+    """
+    queued = {job[0] for job in PENDING_GLTFPACK}
+    waiting = []
+    recorded = False
+
+    for key, entry in pending_entries:
+        outputs = entry["outputs"]
+        if any(path in queued for path in outputs):
+            waiting.append((key, entry))
+            continue
+        if any(path in GLTFPACK_FAILED for path in outputs):
+            continue
+        manifest[key] = entry
+        new_entries[key] = entry
+        recorded = True
+
+    if recorded:
+        save_cache_manifest(new_entries, manifest_path)
+    return waiting
 
-    return (folder_key, files[model_idx])
+
+def is_model_cached(manifest, filepath, fingerprint):
+    """Check the manifest entry matches and every recorded output still exists."""
+    entry = manifest.get(os.path.abspath(filepath))
+    return (
+        entry is not None
+        and entry["fingerprint"] == fingerprint
+        and all(os.path.exists(path) for path in entry["outputs"])
+    )
 
 
 # =============================================================================
 # BATCH PROCESSING
 # =============================================================================
 
-def process_folder(folder_path, category, output_dir):
-    """Process all GLB files in a folder."""
+def process_folder(folder_path, category, output_dir, shard=None):
+    """
+    Process all GLB files in a folder.
+
+    Args:
+        folder_path: Folder containing GLB files
+        category: Category name (for LOD ratio lookup)
+        output_dir: Output directory
+        shard: Optional (index, count) - only process every count-th file
+               starting at index (used by parallel batch workers)
+    """
     files = get_glb_files(folder_path)
+    if shard:
+        shard_index, shard_count = shard
+        files = files[shard_index::shard_count]
     total = len(files)
 
     print(f"\n{'='*70}")
@@ -1123,22 +1746,207 @@ def process_folder(folder_path, category, output_dir):
     print(f"  GLB files: {total}")
     print(f"{'='*70}")
 
+    use_cache = SETTINGS["skip_unchanged"] and not TEST_MODE
+    if use_cache:
+        if shard:
+            # The parent consolidated before launching; workers only read it
+            manifest = read_cache_manifest(get_cache_manifest_path(output_dir))
+            new_entries = {}
+        else:
+            manifest = consolidate_cache_manifests(output_dir)
+            new_entries = manifest
+        manifest_path = get_cache_manifest_path(output_dir, shard)
+        pending_entries = []  # approved models, recorded once gltfpack is done
+
+    status = "done"
     for i, filepath in enumerate(files):
         filename = Path(filepath).stem
         print(f"\n  [{i+1}/{total}] {filename}")
 
+        if use_cache:
+            fingerprint = get_model_fingerprint(filepath, category)
+            if is_model_cached(manifest, filepath, fingerprint):
+                print("    Unchanged since last export - skipping")
+                continue
+
         if not TEST_MODE:
             clear_scene()
 
         result = process_glb_model(filepath, category, output_dir)
 
+        if result in ("quit", "test_done"):
+            status = result
+            break
+
+        if use_cache and result == "approve":
+            pending_entries.append((os.path.abspath(filepath), {
+                "fingerprint": fingerprint,
+                "outputs": get_expected_outputs(filename, category, output_dir),
+            }))
+            pending_entries = record_finished_cache_entries(
+                pending_entries, manifest, new_entries, manifest_path
+            )
+
+    # Outputs are only final once their gltfpack jobs have finished
+    finish_pending_gltfpack()
+    if use_cache:
+        record_finished_cache_entries(pending_entries, manifest, new_entries, manifest_path)
+
+    return status
+
+
+def run_batch(shard=None):
+    """Process every configured input folder in order."""
+    folder_order = ["decorations", "resources", "buildings", "units"]
+
+    for folder_key in folder_order:
+        if folder_key not in INPUT_FOLDERS:
+            continue
+
+        folder_path = INPUT_FOLDERS[folder_key]
+        if not folder_path or folder_path.startswith("/path/to"):
+            print(f"\n  Skipping {folder_key} (path not configured)")
+            continue
+
+        category_output = os.path.join(OUTPUT_FOLDER, folder_key)
+        os.makedirs(category_output, exist_ok=True)
+
+        result = process_folder(folder_path, folder_key, category_output, shard)
+
         if result == "quit":
-            return "quit"
+            break
+
+
+# =============================================================================
+# PARALLEL BATCH WORKERS
+# =============================================================================
+
+def parse_worker_args():
+    """
+    Parse worker arguments passed after Blender's "--" separator.
+
+    Workers are launched as:
+        blender --background --python auto_retopo.py -- --shard I --of N
+
+    Returns:
+        tuple: (shard_index, shard_count), or None when not running as a worker
+    """
+    import argparse
+
+    if "--" not in sys.argv:
+        return None
+
+    parser = argparse.ArgumentParser(prog="auto_retopo.py")
+    parser.add_argument("--shard", type=int)
+    parser.add_argument("--of", type=int, dest="shard_count")
+    args, _ = parser.parse_known_args(sys.argv[sys.argv.index("--") + 1:])
+
+    if args.shard is None or args.shard_count is None:
+        return None
+
+    if args.shard_count < 1 or not 0 <= args.shard < args.shard_count:
+        print(f"  ERROR: Invalid shard {args.shard}/{args.shard_count}")
+        return None
+
+    return args.shard, args.shard_count
+
+
+def resolve_script_source():
+    """
+    Find the script file that parallel workers should run.
 
-        if result == "test_done":
-            return "test_done"
+    Run Script in the Text Editor sets __file__ to "<blend path>/<text name>",
+    so the file on disk comes from the running Text datablock's filepath.
+    With "blender --python", __file__ is the file itself.
+
+    Returns:
+        tuple: (script_path, text) - text is the running Text datablock, or
+               None when launched with --python. script_path is None when
+               the script has never been saved to disk.
+    """
+    text = bpy.data.texts.get(os.path.basename(__file__))
+    if text is not None:
+        if not text.filepath or text.is_in_memory:
+            return None, text
+        return os.path.abspath(bpy.path.abspath(text.filepath)), text
+
+    if os.path.isfile(__file__):
+        return os.path.abspath(__file__), None
+    return None, None
+
+
+def run_parallel_batch(worker_count):
+    """
+    Split the batch across headless Blender processes, one shard each.
+
+    Returns:
+        bool: True if the workers ran, False if the batch should run serially
+    """
+    import subprocess
+
+    script_path, text = resolve_script_source()
+    if script_path is None or not os.path.isfile(script_path):
+        print("  WARNING: Script is not saved to disk, can't launch parallel workers")
+        print("           Save the script or set parallel_workers = 0")
+        return False
+
+    # Workers load the script from disk, so unsaved Text Editor edits
+    # (SETTINGS, INPUT_FOLDERS, ...) would be silently ignored by them.
+    # is_modified covers the file changing on disk after it was opened.
+    if text is not None and (text.is_dirty or text.is_modified):
+        print("  WARNING: Script has unsaved changes in the Text Editor")
+        print("           Parallel workers would run the version on disk instead")
+        print("           Save the script (Text > Save) to use parallel workers")
+        return False
+
+    worker_count = min(worker_count, os.cpu_count() or 1)
+
+    # Workers read only the main cache manifest, so fold in any shard files
+    # an interrupted run left behind first
+    if SETTINGS["skip_unchanged"]:
+        consolidate_all_cache_manifests()
+
+    print(f"\n  Launching {worker_count} headless Blender workers...")
+
+    workers = []
+    for shard_index in range(worker_count):
+        cmd = [
+            bpy.app.binary_path, "--background", "--factory-startup",
+            # Without this Blender exits 0 even when the script raises
+            "--python-exit-code", "1",
+            "--python", script_path,
+            "--", "--shard", str(shard_index), "--of", str(worker_count),
+        ]
+        workers.append(subprocess.Popen(cmd))
+
+    failed = 0
+    for shard_index, proc in enumerate(workers):
+        if proc.wait() != 0:
+            print(f"  WARNING: Worker {shard_index + 1}/{worker_count} exited with code {proc.returncode}")
+            failed += 1
+
+    if failed:
+        print(f"  {failed} worker(s) failed - check the log above")
+
+    if SETTINGS["skip_unchanged"]:
+        consolidate_all_cache_manifests()
+    return True
 
-    return "done"
+
+def run_worker(shard_index, shard_count):
+    """Entry point for a headless batch worker: process one shard, no prompts."""
+    global TEST_MODE
+    TEST_MODE = False
+    SETTINGS["auto_approve"] = True
+
+    # The toktx/gltfpack job limits are a budget for the whole machine;
+    # split it between the workers so N workers don't each claim all of it
+    SETTINGS["ktx2_parallel_jobs"] = max(1, get_parallel_jobs("ktx2_parallel_jobs") // shard_count)
+    SETTINGS["gltfpack_parallel_jobs"] = max(1, get_parallel_jobs("gltfpack_parallel_jobs") // shard_count)
+
+    print(f"\n  WORKER {shard_index + 1}/{shard_count}")
+    clear_scene()
+    run_batch(shard=(shard_index, shard_count))
 
 
 # =============================================================================
@@ -1147,6 +1955,11 @@ def process_folder(folder_path, category, output_dir):
 
 def main():
     """Main entry point."""
+    worker_shard = parse_worker_args()
+    if worker_shard:
+        run_worker(*worker_shard)
+        return
+
     print("\n" + "="*70)
     if TEST_MODE:
         print("  VOIDSTRIKE GLB LOD GENERATOR - TEST MODE")
@@ -1177,24 +1990,16 @@ def main():
         return
 
     # BATCH MODE
-    folder_order = ["decorations", "resources", "buildings", "units"]
-
-    for folder_key in folder_order:
-        if folder_key not in INPUT_FOLDERS:
-            continue
-
-        folder_path = INPUT_FOLDERS[folder_key]
-        if not folder_path or folder_path.startswith("/path/to"):
-            print(f"\n  Skipping {folder_key} (path not configured)")
-            continue
-
-        category_output = os.path.join(OUTPUT_FOLDER, folder_key)
-        os.makedirs(category_output, exist_ok=True)
-
-        result = process_folder(folder_path, folder_key, category_output)
-
-        if result == "quit":
-            break
+    # Models are independent, so with auto-approve the batch can be split
+    # across headless Blender processes
+    worker_count = SETTINGS.get("parallel_workers", 0)
+    ran_parallel = (
+        worker_count > 1
+        and SETTINGS["auto_approve"]
+        and run_parallel_batch(worker_count)
+    )
+    if not ran_parallel:
+        run_batch()
 
     print("\n" + "="*70)
     print("  BATCH PROCESSING COMPLETE")